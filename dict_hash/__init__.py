@@ -1,5 +1,7 @@
 """Python package for hashing dictionaries and other objects."""
 
+from importlib.util import find_spec
+
 from dict_hash.dict_hash import (
     md5,
     sha256,
@@ -15,12 +17,16 @@ from dict_hash.dict_hash import (
     sha3_224,
     blake2s,
     blake2b,
+    blake3,
+    xxh3_128,
     dict_hash,
     NotHashableException,
     NotHashableWarning,
 )
-from dict_hash.hashable import Hashable
+from dict_hash.hashable import Hashable, CachedHashable
 from dict_hash.validate_consistent_hash import validate_consistent_hash
+from dict_hash.dict_hash_batch import dict_hash_batch
+from dict_hash.multi_hash import multi_hash
 
 ALL_AVAILABLE_HASHES = [
     md5,
@@ -39,6 +45,14 @@ ALL_AVAILABLE_HASHES = [
     blake2b,
 ]
 
+# The blake3 hash is only available when its optional dependency is installed.
+if find_spec("blake3") is not None:
+    ALL_AVAILABLE_HASHES.append(blake3)
+
+# Similarly, the xxh3_128 hash requires the optional xxhash dependency.
+if find_spec("xxhash") is not None:
+    ALL_AVAILABLE_HASHES.append(xxh3_128)
+
 __all__ = [
     "md5",
     "sha256",
@@ -54,9 +68,14 @@ __all__ = [
     "sha3_224",
     "blake2s",
     "blake2b",
+    "blake3",
+    "xxh3_128",
     "ALL_AVAILABLE_HASHES",
     "dict_hash",
+    "dict_hash_batch",
+    "multi_hash",
     "Hashable",
+    "CachedHashable",
     "validate_consistent_hash",
     "NotHashableException",
     "NotHashableWarning",
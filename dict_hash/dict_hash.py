@@ -1,11 +1,13 @@
 """Module containing the main function of the package."""
 
 import datetime
+import functools
 import hashlib
-import inspect
 import json
+import sys
+import types
 import warnings
-from typing import Dict, List, Any, Tuple, Callable
+from typing import Dict, List, Any, Tuple, Callable, Optional, Union
 import re
 from deflate_dict import deflate
 
@@ -25,23 +27,129 @@ IGNORED_UNASHABLE_OBJECT_ATTRIBUTES = [
 ]
 
 
+# Since Python 3.9 the hash constructors can be flagged as not being used for
+# security purposes: the digests we compute are identifiers and not signatures,
+# and the flag keeps algorithms such as md5 available on FIPS-enabled builds
+# of OpenSSL, which would otherwise refuse to instantiate them.
+_HASH_CONSTRUCTOR_KWARGS: Dict[str, bool] = (
+    {"usedforsecurity": False} if sys.version_info >= (3, 9) else {}
+)
+
+# Converters of the most common leaf types, indexed by their exact type: they
+# are resolved with a single dictionary lookup instead of walking through the
+# chain of isinstance checks in `_convert`, which still handles subclasses.
+_LEAF_CONVERTERS: Dict[type, Callable[[Any], Any]] = {
+    type(None): lambda data: "None",
+    str: lambda data: data,
+    int: lambda data: data,
+    float: lambda data: data,
+    bool: lambda data: data,
+    bytes: bytes.decode,
+    datetime.date: datetime.date.isoformat,
+    datetime.datetime: datetime.datetime.isoformat,
+    datetime.timedelta: datetime.timedelta.total_seconds,
+    # Compiled regular expressions cannot be subclassed, so they are
+    # entirely handled by their leaf converter.
+    re.Pattern: lambda data: data.pattern,
+}
+
+
+def _numpy_leaf_converters(np: Any) -> Dict[type, Callable[[Any], Any]]:
+    """Returns converters of the numpy scalar types, indexed by their exact type.
+
+    Parameters
+    ------------------
+    np: module
+        The numpy module, which is not imported by this package.
+    """
+    converters: Dict[type, Callable[[Any], Any]] = {
+        integer_type: int
+        for integer_type in (
+            np.uint64,
+            np.uint32,
+            np.uint16,
+            np.uint8,
+            np.int64,
+            np.int32,
+            np.int16,
+            np.int8,
+        )
+    }
+    converters.update(
+        {float_type: float for float_type in (np.float64, np.float32, np.float16)}
+    )
+    converters[np.str_] = str
+    # Fixed-length numpy bytes are instances of bytes, which we decode.
+    converters[np.bytes_] = bytes.decode
+    return converters
+
+
+@functools.lru_cache(maxsize=1024)
+def _callable_source(function: Any, filename: Optional[str] = None) -> str:
+    """Returns the source code of given callable or code object.
+
+    Retrieving the source code requires reading and tokenizing the file
+    where the callable is defined, so we cache it for the callables that
+    are hashed repeatedly, such as functions referenced in configurations.
+
+    Parameters
+    ------------------
+    function: Any
+        The callable or code object whose source code is requested.
+    filename: Optional[str] = None
+        The file where the code object is defined, which is only part of the
+        key of the cache, as code objects compare equal when their bytecode
+        does, regardless of the file they were compiled from.
+    """
+    # The inspect module alone takes about half of the import time of
+    # this package, so we only import it when a callable is hashed.
+    import inspect  # pylint: disable=import-outside-toplevel
+
+    try:
+        return "".join(inspect.getsourcelines(function)[0])
+    except TypeError:
+        # Builtin functions and classes implemented in C have no source
+        # code, so we identify them by their qualified name instead.
+        qualname = getattr(function, "__qualname__", None)
+        if qualname is None:
+            raise
+        return f"{getattr(function, '__module__', None)}.{qualname}"
+
+
+def _is_built_in_value(attribute: Any) -> bool:
+    """Returns whether the value of an attribute is builtin"""
+    return (attribute.__class__.__module__ in ("__builtin__", "builtins")) or type(
+        attribute
+    ).__name__ in ("method-wrapper", "builtin_function_or_method")
+
+
 def is_built_in_attribute(obj: Any, attribute_name: str) -> bool:
     """Returns whether attribute is builtin"""
     try:
-        attribute = getattr(obj, attribute_name)
-        return (attribute.__class__.__module__ in ("__builtin__", "builtins")) or type(
-            attribute
-        ).__name__ in ("method-wrapper", "builtin_function_or_method")
+        return _is_built_in_value(getattr(obj, attribute_name))
     except (AttributeError, ValueError):
         return True
 
 
+def _check_recursion_depth(current_depth: int, maximal_recursion: int):
+    """Raises RecursionError when given depth exceeds the maximal recursion."""
+    if current_depth > maximal_recursion:
+        raise RecursionError(
+            (
+                f"Recursion depth exceeded {maximal_recursion}. "
+                "Please consider increasing the maximal recursion depth "
+                "or simplifying the object to hash."
+            )
+        )
+
+
 def _convert(
     data: Any,
     current_depth: int = 0,
     use_approximation: bool = False,
     behavior_on_error: str = "raise",
     maximal_recursion: int = 100,
+    memo: Optional[Dict[int, Tuple[Any, Any, int]]] = None,
 ) -> Any:
     """Returns given data as an hashable object or dictionary.
 
@@ -65,6 +173,11 @@ def _convert(
         without raising any error or warning.
     maximal_recursion: int = 100
         Maximum recursion depth allowed.
+    memo: Optional[Dict[int, Tuple[Any, Any, int]]] = None
+        Containers already converted during the current call, indexed
+        by their identifier, alongside the original container so that
+        its identifier cannot be reused while the call is running, and
+        the depth at which they were converted.
 
     Returns
     ------------------
@@ -80,18 +193,76 @@ def _convert(
     NotHashableWarning
         When we have no clue what to do with the provided object yet and we need to warn the user.
     """
-    if current_depth > maximal_recursion:
-        raise RecursionError(
-            (
-                f"Recursion depth exceeded {maximal_recursion}. "
-                "Please consider increasing the maximal recursion depth "
-                "or simplifying the object to hash."
-            )
+    _check_recursion_depth(current_depth, maximal_recursion)
+
+    converter = _LEAF_CONVERTERS.get(type(data))
+    if converter is not None:
+        return converter(data)
+
+    # Lists, dictionaries and sets that appear several times within the
+    # object to hash, such as a configuration shared by many records, are
+    # converted only once per call: we store the converted object in the
+    # memo alongside the original one, which is kept alive so that its
+    # identifier cannot be reused by another object during the call, and
+    # the depth at which it was converted. An object found deeper than that
+    # is converted again, as its own nested objects may now exceed the
+    # maximal recursion.
+    if memo is None:
+        memo = {}
+
+    # Just like the leaves, the builtin containers are resolved with a single
+    # lookup on their exact type, before the chain of isinstance checks.
+    container_converter = _CONTAINER_CONVERTERS.get(type(data))
+    if container_converter is not None:
+        return container_converter(
+            data,
+            current_depth=current_depth,
+            use_approximation=use_approximation,
+            behavior_on_error=behavior_on_error,
+            maximal_recursion=maximal_recursion,
+            memo=memo,
         )
 
-    # If the object is a None.
-    if data is None:
-        return "None"
+    # Any other object, such as a numpy array, a dataframe or an Hashable
+    # object, is similarly converted only once per call.
+    memoized = memo.get(id(data))
+    if memoized is None or memoized[2] < current_depth:
+        memoized = memo[id(data)] = (
+            data,
+            _convert_object(
+                data,
+                current_depth=current_depth,
+                use_approximation=use_approximation,
+                behavior_on_error=behavior_on_error,
+                maximal_recursion=maximal_recursion,
+                memo=memo,
+            ),
+            current_depth,
+        )
+    return memoized[1]
+
+
+def _convert_object(
+    data: Any,
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> Any:
+    """Returns given object, which is neither a leaf nor a builtin container, converted.
+
+    Raises
+    ------------------
+    NotHashableException
+        When we have no clue what to do with the provided object yet and we need to raise an error.
+
+    Warns
+    ------------------
+    NotHashableWarning
+        When we have no clue what to do with the provided object yet and we need to warn the user.
+    """
+
     # If given object is of type Hashable
     if isinstance(data, Hashable):
         # we call its method to convert it to an hash
@@ -113,10 +284,19 @@ def _convert(
                 DeprecationWarning,
             )
             return data.consistent_hash()
-    # If we are handling an instance of fixed-length numpy strings we need to
-    # convert them back to a normal python string so that they may be hashed.
+    # If we are handling byte strings, such as instances of fixed-length numpy
+    # strings, we need to convert them back to a normal python string so that
+    # they may be hashed.
     if isinstance(data, bytes):
         return data.decode()
+    # Byte arrays and memory views are decoded just like bytes, but as they
+    # commonly hold arbitrary binary data, those that are not valid UTF-8
+    # are handled as any other object we cannot hash.
+    if isinstance(data, (bytearray, memoryview)):
+        try:
+            return bytes(data).decode()
+        except UnicodeDecodeError:
+            return _handle_unhashable_object(data, behavior_on_error)
     # If given object is either a date or datetime object
     if isinstance(data, datetime.date):
         # we convert the object to the string version
@@ -131,11 +311,20 @@ def _convert(
     # Handling hashing of numpy string objects #
     ############################################
 
-    try:
-        import numpy as np  # pylint: disable=import-outside-toplevel
-    except ModuleNotFoundError:
-        pass
-    else:
+    # An object can only belong to one of the optional libraries we support
+    # if the library has already been imported, so we look it up among the
+    # loaded modules instead of importing it: this avoids both the cost of
+    # the import machinery at every recursive call and loading heavy
+    # libraries such as pandas or numba that the user never asked for.
+    np = sys.modules.get("numpy")
+    if np is not None:
+        # The first time we find numpy loaded, we register its scalar types
+        # among the leaf converters, so that the following numpy scalars are
+        # converted with a single lookup on their exact type. The checks
+        # below remain to handle their subclasses.
+        if np.int64 not in _LEAF_CONVERTERS:
+            _LEAF_CONVERTERS.update(_numpy_leaf_converters(np))
+
         # If the given object is a numpy integer, we convert it to a python integer.
         if isinstance(
             data,
@@ -161,14 +350,8 @@ def _convert(
             if isinstance(data, (np.float64, np.float32, np.float16)):
                 return float(data)
 
-        # If the given object is a numpy string, we convert it to a python string.
-        try:
-            string_np_types = (np.str_, np.bytes_)
-        except AttributeError:
-            string_np_types = (np.str_, np.string_)  # type: ignore
-
-        if isinstance(data, string_np_types):
-            return str(data)
+        # Numpy strings need no dedicated handling: np.str_ is a subclass of
+        # str and np.bytes_ of bytes, so they are converted as those are.
 
     # If the given data is a simple object such as a string, an integer
     # or a float we can leave it to be hashed.
@@ -179,11 +362,8 @@ def _convert(
     # Handling hashing of pandas objects       #
     ############################################
 
-    try:
-        import pandas as pd  # pylint: disable=import-outside-toplevel
-    except ModuleNotFoundError:
-        pass
-    else:
+    pd = sys.modules.get("pandas")
+    if pd is not None:
         # A similar behaviour is required for DataFrames.
         if isinstance(data, pd.DataFrame):
             # We store the initial shape of the dataframe, so
@@ -210,12 +390,14 @@ def _convert(
                         use_approximation=use_approximation,
                         behavior_on_error=behavior_on_error,
                         maximal_recursion=maximal_recursion,
+                        memo=memo,
                     ),
                     "shape": shape,
                 },
                 current_depth=current_depth + 1,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
         if isinstance(data, pd.Series):
             shape = data.shape
@@ -232,23 +414,22 @@ def _convert(
                         use_approximation=use_approximation,
                         behavior_on_error=behavior_on_error,
                         maximal_recursion=maximal_recursion,
+                        memo=memo,
                     ),
                     "name": data.name,
                 },
                 current_depth=current_depth + 1,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
 
     ############################################
     # Handling hashing of Polars objects       #
     ############################################
 
-    try:
-        import polars as pl  # pylint: disable=import-outside-toplevel
-    except ModuleNotFoundError:
-        pass
-    else:
+    pl = sys.modules.get("polars")
+    if pl is not None:
         # A similar behaviour is required for DataFrames.
         if isinstance(data, pl.DataFrame):
             # We store the initial shape of the dataframe, so
@@ -264,9 +445,10 @@ def _convert(
                 if data.shape[1] > 50:
                     data = data[data.columns[:50]]
                 # We sample 50 random lines of the dataframe, as some dataframes
-                # can contain millions of samples.
+                # can contain millions of samples. Just like for pandas, the
+                # seed is fixed so that the approximated hash is deterministic.
                 if data.shape[0] > 50:
-                    data = data.sample(n=50)
+                    data = data.sample(n=50, seed=42)
             return _convert(
                 {
                     "hash": _convert(
@@ -275,45 +457,49 @@ def _convert(
                         use_approximation=use_approximation,
                         behavior_on_error=behavior_on_error,
                         maximal_recursion=maximal_recursion,
+                        memo=memo,
                     ),
                     "shape": shape,
                 },
                 current_depth=current_depth + 1,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
         if isinstance(data, pl.Series):
+            # Polars does not necessarily import numpy, which we need
+            # to convert the series to an array.
+            import numpy  # pylint: disable=import-outside-toplevel
+
             number_of_elements: int = data.shape[0]
 
             if use_approximation:
                 if number_of_elements > 50:
-                    data = data.sample(n=50)
+                    data = data.sample(n=50, seed=42)
 
             return _convert(
                 {
                     "hash": _convert(
-                        np.array(data),
+                        numpy.array(data),
                         current_depth=current_depth + 1,
                         use_approximation=use_approximation,
                         behavior_on_error=behavior_on_error,
                         maximal_recursion=maximal_recursion,
+                        memo=memo,
                     ),
                     "name": data.name,
                 },
                 current_depth=current_depth + 1,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
 
     ############################################
     # Handling hashing of numpy array objects  #
     ############################################
 
-    try:
-        import numpy as np  # pylint: disable=import-outside-toplevel
-    except ModuleNotFoundError:
-        pass
-    else:
+    if np is not None:
         # And numpy arrays.
         if isinstance(data, np.ndarray):
             # We store the initial shape of the array, so
@@ -340,6 +526,34 @@ def _convert(
                     pnrg = np.random.RandomState(42)  # pylint: disable=no-member
                     data = data[pnrg.randint(data.shape[0], size=50)]
 
+            # Arrays of booleans, numbers or strings are converted by tolist
+            # directly into nested lists of python primitives, which are already
+            # hashable: we skip the element-wise recursion, which on large arrays
+            # dominates the cost of the whole hashing procedure. Extended
+            # precision floats are excluded, as tolist keeps them as numpy
+            # scalars, which are handled by the recursion instead.
+            if data.dtype.kind in "biuU" or data.dtype in (
+                np.float16,
+                np.float32,
+                np.float64,
+            ):
+                # As the nested lists are not converted recursively, we check
+                # the depth their elements would reach within the converted
+                # dictionary: its values are three levels below the array,
+                # and every non-empty dimension nests the elements one more.
+                nested_depth = current_depth + 3
+                for dimension in data.shape:
+                    if dimension == 0:
+                        break
+                    nested_depth += 1
+                if array_shape:
+                    nested_depth = max(nested_depth, current_depth + 4)
+                _check_recursion_depth(nested_depth, maximal_recursion)
+                return {
+                    "hash": data.tolist(),
+                    "shape": array_shape,
+                }
+
             return _convert(
                 {
                     "hash": _convert(
@@ -348,140 +562,121 @@ def _convert(
                         use_approximation=use_approximation,
                         behavior_on_error=behavior_on_error,
                         maximal_recursion=maximal_recursion,
+                        memo=memo,
                     ),
                     "shape": array_shape,
                 },
                 current_depth=current_depth + 1,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
 
     ############################################
     # Handling hashing of numba array objects  #
     ############################################
 
-    try:
-        from numba import typed  # pylint: disable=import-outside-toplevel
-    except (ModuleNotFoundError, ImportError):
-        pass
-    else:
+    typed = sys.modules.get("numba.typed")
+    if typed is not None:
         try:
-            # And iterables such as lists and tuples.
+            # Numba typed lists and dictionaries are converted just like
+            # the builtin containers.
             if isinstance(data, typed.List):
-                return [
-                    _convert(
-                        e,
-                        current_depth=current_depth + 1,
-                        use_approximation=use_approximation,
-                        behavior_on_error=behavior_on_error,
-                        maximal_recursion=maximal_recursion,
-                    )
-                    for e in data
-                ]
-            # If it is a dictionary we need to hash every element of it.
+                return _convert_list(
+                    data,
+                    current_depth=current_depth,
+                    use_approximation=use_approximation,
+                    behavior_on_error=behavior_on_error,
+                    maximal_recursion=maximal_recursion,
+                    memo=memo,
+                )
             if isinstance(data, typed.Dict):
-                return dict(
-                    [
-                        _convert(
-                            (key, value),
-                            current_depth=current_depth + 1,
-                            use_approximation=use_approximation,
-                            behavior_on_error=behavior_on_error,
-                            maximal_recursion=maximal_recursion,
-                        )
-                        for key, value in data.items()
-                    ]
+                return _convert_dict(
+                    data,
+                    current_depth=current_depth,
+                    use_approximation=use_approximation,
+                    behavior_on_error=behavior_on_error,
+                    maximal_recursion=maximal_recursion,
+                    memo=memo,
                 )
         # In some old numba versions there is no attribute
         # List of Dict in typed.
         except AttributeError:
             pass
 
-    # And iterables such as lists and tuples.
-    if isinstance(data, list):
-        return [
-            _convert(
-                e,
-                current_depth=current_depth + 1,
-                use_approximation=use_approximation,
-                behavior_on_error=behavior_on_error,
-                maximal_recursion=maximal_recursion,
-            )
-            for e in data
-        ]
-
-    # If it is a dictionary we need to hash every element of it.
-    if isinstance(data, dict):
-        return dict(
-            _convert(
-                (key, value),
-                current_depth=current_depth + 1,
-                use_approximation=use_approximation,
-                behavior_on_error=behavior_on_error,
-                maximal_recursion=maximal_recursion,
-            )
-            for key, value in data.items()
-        )
-
-    # And iterables such as lists and tuples.
-    if isinstance(data, tuple):
-        return tuple(
-            _convert(
-                e,
-                current_depth=current_depth + 1,
+    # Subclasses of the builtin containers, such as OrderedDict or
+    # defaultdict, are converted just like the containers they extend.
+    for container_type, container_converter in _CONTAINER_CONVERTERS.items():
+        if isinstance(data, container_type):
+            return container_converter(
+                data,
+                current_depth=current_depth,
                 use_approximation=use_approximation,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             )
-            for e in data
-        )
-
-    if isinstance(data, set):
-        return sorted(
-            [
-                _convert(
-                    e,
-                    current_depth=current_depth + 1,
-                    use_approximation=use_approximation,
-                    behavior_on_error=behavior_on_error,
-                    maximal_recursion=maximal_recursion,
-                )
-                for e in data
-            ]
-        )
-
-    if isinstance(data, re.Pattern):
-        return data.pattern
 
     if callable(data):
-        return "".join(inspect.getsourcelines(data)[0])
+        # Functions created anew at every call, such as lambdas and closures,
+        # are distinct objects sharing the same code object, which we use as
+        # the key of the cache when available. Decorated functions are excluded,
+        # as their source is the one of the function they wrap.
+        code = getattr(data, "__code__", None)
+        if isinstance(code, types.CodeType) and not hasattr(data, "__wrapped__"):
+            return _callable_source(code, code.co_filename)
+        # The few callables that cannot be used as keys of the cache of
+        # their sources, such as instances of classes defining __eq__
+        # without __hash__, are converted without the cache.
+        try:
+            hash(data)
+        except TypeError:
+            return _callable_source.__wrapped__(data)
+        return _callable_source(data)
 
     ############################################
     # Handling hashing of Ensmallen objects    #
     ############################################
 
-    try:
-        from ensmallen import Graph  # type: ignore
-    except ModuleNotFoundError:
-        pass
-    else:
-        if isinstance(data, Graph):
+    ensmallen = sys.modules.get("ensmallen")
+    if ensmallen is not None:
+        if isinstance(data, ensmallen.Graph):
             return data.hash()
 
     try:
-        return _sanitize(
-            {
-                key: getattr(data, key)
-                for key in dir(data)
-                if (
-                    key not in IGNORED_UNASHABLE_OBJECT_ATTRIBUTES
-                    and not is_built_in_attribute(data, key)
-                )
-            },
-        )
+        # We retrieve each attribute only once, as retrieving it may be
+        # expensive, for instance when it is a property.
+        attributes: Dict[str, Any] = {}
+        for key in dir(data):
+            if key in IGNORED_UNASHABLE_OBJECT_ATTRIBUTES:
+                continue
+            try:
+                attribute = getattr(data, key)
+            except (AttributeError, ValueError):
+                continue
+            if not _is_built_in_value(attribute):
+                attributes[key] = attribute
+        # The attributes are converted with the default settings rather than
+        # the ones of the current call, so they get a memo of their own: the
+        # conversions of the objects they share with the rest of the call
+        # differ, and must not be reused across the two.
+        return _sanitize(attributes)
     except (NotHashableException, TypeError, RecursionError):
         pass
 
+    return _handle_unhashable_object(data, behavior_on_error)
+
+
+def _handle_unhashable_object(data: Any, behavior_on_error: str) -> str:
+    """Returns placeholder of given unhashable object, or raises as requested.
+
+    Parameters
+    ------------------
+    data: Any
+        The object that could not be converted.
+    behavior_on_error: str
+        Whether to raise an error, warn the user or silently ignore the object.
+    """
     if behavior_on_error == "ignore":
         return "Unhashable object"
 
@@ -508,12 +703,206 @@ def _convert(
     raise NotHashableException(message)
 
 
+def _convert_list(
+    data: list,
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> List:
+    """Returns given list with its elements converted by `_convert`."""
+    # The elements of lists, tuples and sets are most commonly primitive
+    # values, which we convert directly with their leaf converter to avoid
+    # a recursive call of `_convert` for each of them. As these conversions
+    # skip the depth check of `_convert`, we check the depth of the elements
+    # once for the whole container.
+    if data:
+        _check_recursion_depth(current_depth + 1, maximal_recursion)
+    memoized = memo.get(id(data))
+    if memoized is None or memoized[2] < current_depth:
+        memoized = memo[id(data)] = (
+            data,
+            [
+                (
+                    _LEAF_CONVERTERS[type(e)](e)
+                    if type(e) in _LEAF_CONVERTERS
+                    else _convert(
+                        e,
+                        current_depth=current_depth + 1,
+                        use_approximation=use_approximation,
+                        behavior_on_error=behavior_on_error,
+                        maximal_recursion=maximal_recursion,
+                        memo=memo,
+                    )
+                )
+                for e in data
+            ],
+            current_depth,
+        )
+    return memoized[1]
+
+
+def _convert_dict(
+    data: dict,
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> Dict:
+    """Returns given dictionary with its items converted by `_convert`."""
+    # Keys and values are converted separately instead of as (key, value)
+    # tuples, which would be allocated and unpacked again for every item:
+    # they are at two levels of depth from the dictionary, as they were
+    # when they were nested within the tuples.
+    if data:
+        _check_recursion_depth(current_depth + 2, maximal_recursion)
+    memoized = memo.get(id(data))
+    if memoized is None or memoized[2] < current_depth:
+        memoized = memo[id(data)] = (
+            data,
+            {
+                (
+                    _LEAF_CONVERTERS[type(key)](key)
+                    if type(key) in _LEAF_CONVERTERS
+                    else _convert(
+                        key,
+                        current_depth=current_depth + 2,
+                        use_approximation=use_approximation,
+                        behavior_on_error=behavior_on_error,
+                        maximal_recursion=maximal_recursion,
+                        memo=memo,
+                    )
+                ): (
+                    _LEAF_CONVERTERS[type(value)](value)
+                    if type(value) in _LEAF_CONVERTERS
+                    else _convert(
+                        value,
+                        current_depth=current_depth + 2,
+                        use_approximation=use_approximation,
+                        behavior_on_error=behavior_on_error,
+                        maximal_recursion=maximal_recursion,
+                        memo=memo,
+                    )
+                )
+                for key, value in data.items()
+            },
+            current_depth,
+        )
+    return memoized[1]
+
+
+def _convert_tuple(
+    data: tuple,
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> Tuple:
+    """Returns given tuple with its elements converted by `_convert`."""
+    if data:
+        _check_recursion_depth(current_depth + 1, maximal_recursion)
+    # Building the tuple from a list comprehension is considerably faster
+    # than from a generator expression, which is resumed for every element.
+    return tuple(
+        [
+            (
+                _LEAF_CONVERTERS[type(e)](e)
+                if type(e) in _LEAF_CONVERTERS
+                else _convert(
+                    e,
+                    current_depth=current_depth + 1,
+                    use_approximation=use_approximation,
+                    behavior_on_error=behavior_on_error,
+                    maximal_recursion=maximal_recursion,
+                    memo=memo,
+                )
+            )
+            for e in data
+        ]
+    )
+
+
+def _convert_set(
+    data: Union[set, frozenset],
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> List:
+    """Returns sorted list of the elements of given set converted by `_convert`."""
+    if data:
+        _check_recursion_depth(current_depth + 1, maximal_recursion)
+    memoized = memo.get(id(data))
+    if memoized is None or memoized[2] < current_depth:
+        memoized = memo[id(data)] = (
+            data,
+            sorted(
+                [
+                    (
+                        _LEAF_CONVERTERS[type(e)](e)
+                        if type(e) in _LEAF_CONVERTERS
+                        else _convert(
+                            e,
+                            current_depth=current_depth + 1,
+                            use_approximation=use_approximation,
+                            behavior_on_error=behavior_on_error,
+                            maximal_recursion=maximal_recursion,
+                            memo=memo,
+                        )
+                    )
+                    for e in data
+                ]
+            ),
+            current_depth,
+        )
+    return memoized[1]
+
+
+def _convert_frozenset(
+    data: frozenset,
+    current_depth: int,
+    use_approximation: bool,
+    behavior_on_error: str,
+    maximal_recursion: int,
+    memo: Dict[int, Tuple[Any, Any, int]],
+) -> Tuple:
+    """Returns sorted tuple of the elements of given frozenset converted by `_convert`."""
+    # Frozensets, unlike sets, may be keys of dictionaries, so we convert
+    # them into tuples, which remain hashable and are serialized as lists.
+    return tuple(
+        _convert_set(
+            data,
+            current_depth=current_depth,
+            use_approximation=use_approximation,
+            behavior_on_error=behavior_on_error,
+            maximal_recursion=maximal_recursion,
+            memo=memo,
+        )
+    )
+
+
+# Converters of the builtin containers, in the order in which `_convert`
+# checks whether the object to hash is an instance of one of them.
+_CONTAINER_CONVERTERS: Dict[type, Callable[..., Any]] = {
+    list: _convert_list,
+    dict: _convert_dict,
+    tuple: _convert_tuple,
+    set: _convert_set,
+    frozenset: _convert_frozenset,
+}
+
+
 def _sanitize(
     dictionary: Dict,
     current_depth: int = 0,
     use_approximation: bool = False,
     behavior_on_error: str = "raise",
     maximal_recursion: int = 100,
+    memo: Optional[Dict[int, Tuple[Any, Any, int]]] = None,
 ) -> str:
     """Return given dictionary as JSON string.
 
@@ -539,6 +928,8 @@ def _sanitize(
         without raising any error or warning.
     maximal_recursion: int = 100
         Maximum recursion depth allowed.
+    memo: Optional[Dict[int, Tuple[Any, Any, int]]] = None
+        Containers already converted during the current call.
 
     Returns
     -------------------
@@ -584,6 +975,7 @@ def _sanitize(
                 use_approximation=use_approximation,
                 behavior_on_error=behavior_on_error,
                 maximal_recursion=maximal_recursion,
+                memo=memo,
             ),
             leave_tuples=True,
         ),
@@ -660,7 +1052,8 @@ def _basic_hash(
             use_approximation=use_approximation,
             behavior_on_error=behavior_on_error,
             maximal_recursion=maximal_recursion,
-        ).encode("utf-8")
+        ).encode("utf-8"),
+        **_HASH_CONSTRUCTOR_KWARGS,
     ).hexdigest(*hexdigest_args)
 
 
@@ -1426,3 +1819,146 @@ def shake_256(
         behavior_on_error=behavior_on_error,
         maximal_recursion=maximal_recursion,
     )
+
+
+def blake3(
+    dictionary: Dict,
+    use_approximation: bool = False,
+    behavior_on_error: str = "raise",
+    maximal_recursion: int = 100,
+) -> str:
+    """Return blake3 of given dict.
+
+    BLAKE3 is considerably faster than the hashlib algorithms on large
+    dictionaries, such as those containing big numpy arrays or pandas
+    dataframes, and requires the optional `blake3` package.
+
+    Parameters
+    ------------------
+    dictionary: Dict
+        Dictionary of which determine an unique hash.
+    use_approximation: bool = False
+        Whether to employ approximations, such as sampling
+        random values in pandas dataframe (using a fixed deterministic
+        random seed) or lines in a numpy array. This is mainly
+        needed when you need to hash frequently big pandas dataframes
+        and you do not care about generating a very precise hash
+        but a decent one will do the trick.
+    behavior_on_error: str = "raise"
+        Whether to raise an error when an unhashable object is found
+        or to return a string representation of the object. The options
+        are "raise", "warn" and "ignore". If "warn" is selected, a warning
+        will be issued using the `warnings` module. If "ignore" is selected,
+        the object will be ignored and the hash will be computed without it
+        without raising any error or warning.
+    maximal_recursion: int = 100
+        Maximum recursion depth allowed.
+
+    Returns
+    ------------------
+    Deterministic hash for the given dictionary.
+
+    Raises
+    ------------------
+    ModuleNotFoundError
+        When the optional `blake3` package is not installed.
+    NotHashableException
+        When an object is not hashable and `behavior_on_error` is set to "raise".
+    ValueError
+        When `behavior_on_error` is not a string or is not in ("raise", "warn", "ignore").
+
+    Warns
+    ------------------
+    NotHashableWarning
+        When an object is not hashable and `behavior_on_error` is set to "warn".
+    """
+    try:
+        from blake3 import (  # pylint: disable=import-outside-toplevel
+            blake3 as blake3_constructor,
+        )
+    except ModuleNotFoundError as exception:
+        raise ModuleNotFoundError(
+            "The blake3 hash requires the optional `blake3` package, "
+            "which you can install by running `pip install blake3`."
+        ) from exception
+
+    return _basic_hash(
+        dictionary,
+        blake3_constructor,
+        use_approximation=use_approximation,
+        behavior_on_error=behavior_on_error,
+        maximal_recursion=maximal_recursion,
+    )
+
+
+def xxh3_128(
+    dictionary: Dict,
+    use_approximation: bool = False,
+    behavior_on_error: str = "raise",
+    maximal_recursion: int = 100,
+) -> str:
+    """Return xxh3_128 of given dict.
+
+    XXH3 is a non-cryptographic hash that runs at memory bandwidth, and it
+    is the fastest option when the hash is only used as an identifier, for
+    instance as a cache key, and not to guard against malicious collisions.
+    It requires the optional `xxhash` package.
+
+    Parameters
+    ------------------
+    dictionary: Dict
+        Dictionary of which determine an unique hash.
+    use_approximation: bool = False
+        Whether to employ approximations, such as sampling
+        random values in pandas dataframe (using a fixed deterministic
+        random seed) or lines in a numpy array. This is mainly
+        needed when you need to hash frequently big pandas dataframes
+        and you do not care about generating a very precise hash
+        but a decent one will do the trick.
+    behavior_on_error: str = "raise"
+        Whether to raise an error when an unhashable object is found
+        or to return a string representation of the object. The options
+        are "raise", "warn" and "ignore". If "warn" is selected, a warning
+        will be issued using the `warnings` module. If "ignore" is selected,
+        the object will be ignored and the hash will be computed without it
+        without raising any error or warning.
+    maximal_recursion: int = 100
+        Maximum recursion depth allowed.
+
+    Returns
+    ------------------
+    Deterministic hash for the given dictionary.
+
+    Raises
+    ------------------
+    ModuleNotFoundError
+        When the optional `xxhash` package is not installed.
+    NotHashableException
+        When an object is not hashable and `behavior_on_error` is set to "raise".
+    ValueError
+        When `behavior_on_error` is not a string or is not in ("raise", "warn", "ignore").
+
+    Warns
+    ------------------
+    NotHashableWarning
+        When an object is not hashable and `behavior_on_error` is set to "warn".
+    """
+    try:
+        from xxhash import (  # pylint: disable=import-outside-toplevel
+            xxh3_128 as xxh3_128_constructor,
+        )
+    except ModuleNotFoundError as exception:
+        raise ModuleNotFoundError(
+            "The xxh3_128 hash requires the optional `xxhash` package, "
+            "which you can install by running `pip install xxhash`."
+        ) from exception
+
+    return _basic_hash(
+        dictionary,
+        # Unlike the hashlib constructors, the xxhash ones do not accept
+        # the `usedforsecurity` flag, which is meaningless for them.
+        lambda data, **_: xxh3_128_constructor(data),
+        use_approximation=use_approximation,
+        behavior_on_error=behavior_on_error,
+        maximal_recursion=maximal_recursion,
+    )
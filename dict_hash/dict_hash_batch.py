@@ -0,0 +1,104 @@
+"""Submodule providing a function to hash many dictionaries at once."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List
+
+from dict_hash.dict_hash import sha256
+
+
+def dict_hash_batch(
+    dictionaries: Iterable[Dict],
+    hash_function: Callable[..., str] = sha256,
+    n_workers: int = 1,
+    use_approximation: bool = False,
+    behavior_on_error: str = "raise",
+    maximal_recursion: int = 100,
+) -> List[str]:
+    """Return list with the hashes of the given dictionaries.
+
+    Parameters
+    ------------------
+    dictionaries: Iterable[Dict]
+        Dictionaries of which determine the hashes.
+    hash_function: Callable[..., str] = sha256
+        Consistent hash function to use, such as `sha256` or `md5`.
+        When using more than one worker, the function must be picklable,
+        as all of the hash functions provided by this package are.
+    n_workers: int = 1
+        Number of processes to use. With a single worker, the dictionaries
+        are hashed in the current process, as they are when they contain
+        objects that cannot be pickled, such as lambdas. Since every
+        dictionary is hashed independently, the hashes are identical to those
+        obtained by calling the hash function on each dictionary.
+    use_approximation: bool = False
+        Whether to employ approximations, such as sampling
+        random values in pandas dataframe (using a fixed deterministic
+        random seed) or lines in a numpy array. This is mainly
+        needed when you need to hash frequently big pandas dataframes
+        and you do not care about generating a very precise hash
+        but a decent one will do the trick.
+    behavior_on_error: str = "raise"
+        Whether to raise an error when an unhashable object is found
+        or to return a string representation of the object. The options
+        are "raise", "warn" and "ignore". If "warn" is selected, a warning
+        will be issued using the `warnings` module. If "ignore" is selected,
+        the object will be ignored and the hash will be computed without it
+        without raising any error or warning.
+    maximal_recursion: int = 100
+        Maximum recursion depth allowed.
+
+    Returns
+    ------------------
+    List with the hashes of the given dictionaries, in the same order.
+
+    Raises
+    ------------------
+    ValueError
+        When the given number of workers is not a strictly positive integer.
+    NotHashableException
+        When an object is not hashable and `behavior_on_error` is set to "raise".
+    ValueError
+        When `behavior_on_error` is not a string or is not in ("raise", "warn", "ignore").
+
+    Warns
+    ------------------
+    NotHashableWarning
+        When an object is not hashable and `behavior_on_error` is set to "warn".
+    """
+    if not isinstance(n_workers, int) or n_workers < 1:
+        raise ValueError(
+            (
+                "The number of workers must be a strictly positive integer, "
+                f"but {n_workers} was provided."
+            )
+        )
+
+    bound_hash_function = partial(
+        hash_function,
+        use_approximation=use_approximation,
+        behavior_on_error=behavior_on_error,
+        maximal_recursion=maximal_recursion,
+    )
+
+    if n_workers == 1:
+        return [bound_hash_function(dictionary) for dictionary in dictionaries]
+
+    dictionaries = list(dictionaries)
+
+    # Sending the dictionaries to the workers one at a time would cost more
+    # than hashing them, so we ship them in a few chunks per worker.
+    chunksize = max(1, len(dictionaries) // (n_workers * 4))
+
+    try:
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            return list(
+                executor.map(bound_hash_function, dictionaries, chunksize=chunksize)
+            )
+    except (pickle.PicklingError, AttributeError, TypeError):
+        # Dictionaries containing objects that cannot be pickled, such as
+        # lambdas or local functions, cannot be sent to the workers, so we
+        # hash them in the current process: any error that was not caused
+        # by pickling is then raised again by the hash function itself.
+        return [bound_hash_function(dictionary) for dictionary in dictionaries]
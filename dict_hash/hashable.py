@@ -1,6 +1,7 @@
 """Submodule that contains the abstract class Hashable."""
 
 from abc import ABC, abstractmethod
+from typing import Dict, Optional
 
 
 class Hashable(ABC):
@@ -51,3 +52,82 @@ class Hashable(ABC):
             "The method consistent_hash must be implemented"
             " by the child classes of Hashable."
         )
+
+
+class CachedHashable(Hashable):
+    """Hashable that stores its consistent hash on the instance itself.
+
+    Objects that are hashed many times, for instance when they are reused
+    across several dictionaries, pay the cost of computing their hash only
+    once: the result is kept in the `_dict_hash_cache` field of the instance,
+    which is read directly on all subsequent calls.
+
+    Child classes implement the method `_consistent_hash` instead of
+    `consistent_hash`. Since the cached value is not recomputed, whenever
+    the state of the object that contributes to the hash changes, the
+    method `invalidate` MUST be called, for instance in the setters:
+
+    ..code::python
+
+        from dict_hash import CachedHashable, sha256
+
+        class MyObject(CachedHashable):
+
+            def __init__(self, a:int):
+                self._a = a
+
+            def set_a(self, a:int):
+                self._a = a
+                self.invalidate()
+
+            def _consistent_hash(self, use_approximation: bool = False)->str:
+                return sha256({
+                    "a":self._a
+                })
+    """
+
+    @abstractmethod
+    def _consistent_hash(self, use_approximation: bool = False) -> str:
+        """Return consistent hash of the current object, without caching.
+
+        Parameters
+        ------------------
+        use_approximation: bool = False
+            If True, the hash can be approximated. This is useful when the
+            hash is too long and we want to use a shorter version of it.
+
+        Returns
+        ------------------
+        A consistent hash of the object.
+        """
+        raise NotImplementedError(
+            "The method _consistent_hash must be implemented"
+            " by the child classes of CachedHashable."
+        )
+
+    def consistent_hash(self, use_approximation: bool = False) -> str:
+        """Return cached consistent hash of the current object.
+
+        Parameters
+        ------------------
+        use_approximation: bool = False
+            If True, the hash can be approximated. This is useful when the
+            hash is too long and we want to use a shorter version of it.
+
+        Returns
+        ------------------
+        A consistent hash of the object.
+        """
+        cache: Optional[Dict[bool, str]] = getattr(self, "_dict_hash_cache", None)
+        if cache is None:
+            cache = {}
+            self._dict_hash_cache = cache
+        if use_approximation not in cache:
+            cache[use_approximation] = self._consistent_hash(
+                use_approximation=use_approximation
+            )
+        return cache[use_approximation]
+
+    def invalidate(self) -> None:
+        """Drop the cached hash, to be called when the object is mutated."""
+        self._dict_hash_cache = {}
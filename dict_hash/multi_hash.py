@@ -0,0 +1,111 @@
+"""Submodule providing a function to hash a dictionary with several algorithms."""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+from dict_hash.dict_hash import _HASH_CONSTRUCTOR_KWARGS, _sanitize
+
+_HASHLIB_CONSTRUCTORS: Dict[str, Callable[..., Any]] = {
+    "md5": hashlib.md5,
+    "sha1": hashlib.sha1,
+    "sha224": hashlib.sha224,
+    "sha256": hashlib.sha256,
+    "sha384": hashlib.sha384,
+    "sha512": hashlib.sha512,
+    "sha3_224": hashlib.sha3_224,
+    "sha3_256": hashlib.sha3_256,
+    "sha3_384": hashlib.sha3_384,
+    "sha3_512": hashlib.sha3_512,
+    "blake2s": hashlib.blake2s,
+    "blake2b": hashlib.blake2b,
+}
+
+# The hashlib constructors release the GIL while hashing large buffers, so
+# the algorithms can run in parallel threads, but starting the threads only
+# pays off on documents considerably larger than the few KB where that happens.
+_MINIMAL_THREADED_DOCUMENT_SIZE = 1024 * 1024
+
+
+def multi_hash(
+    dictionary: Dict,
+    algorithms: List[str],
+    use_approximation: bool = False,
+    behavior_on_error: str = "raise",
+    maximal_recursion: int = 100,
+) -> Dict[str, str]:
+    """Return dictionary with the hashes of given dict for each of the algorithms.
+
+    The dictionary is converted and serialized only once, and the resulting
+    hashes are identical to those returned by the corresponding functions,
+    such as `sha256` or `md5`.
+
+    Parameters
+    ------------------
+    dictionary: Dict
+        Dictionary of which determine the hashes.
+    algorithms: List[str]
+        Names of the algorithms to use, among "md5", "sha1", "sha224",
+        "sha256", "sha384", "sha512", "sha3_224", "sha3_256", "sha3_384",
+        "sha3_512", "blake2s" and "blake2b".
+    use_approximation: bool = False
+        Whether to employ approximations, such as sampling
+        random values in pandas dataframe (using a fixed deterministic
+        random seed) or lines in a numpy array. This is mainly
+        needed when you need to hash frequently big pandas dataframes
+        and you do not care about generating a very precise hash
+        but a decent one will do the trick.
+    behavior_on_error: str = "raise"
+        Whether to raise an error when an unhashable object is found
+        or to return a string representation of the object. The options
+        are "raise", "warn" and "ignore". If "warn" is selected, a warning
+        will be issued using the `warnings` module. If "ignore" is selected,
+        the object will be ignored and the hash will be computed without it
+        without raising any error or warning.
+    maximal_recursion: int = 100
+        Maximum recursion depth allowed.
+
+    Returns
+    ------------------
+    Dictionary with the hash of given dict for each of the algorithms.
+
+    Raises
+    ------------------
+    ValueError
+        When one of the given algorithms is not supported.
+    NotHashableException
+        When an object is not hashable and `behavior_on_error` is set to "raise".
+    ValueError
+        When `behavior_on_error` is not a string or is not in ("raise", "warn", "ignore").
+
+    Warns
+    ------------------
+    NotHashableWarning
+        When an object is not hashable and `behavior_on_error` is set to "warn".
+    """
+    for algorithm in algorithms:
+        if algorithm not in _HASHLIB_CONSTRUCTORS:
+            raise ValueError(
+                (
+                    f"The algorithm {algorithm} is not supported. "
+                    f"Please provide values in {tuple(_HASHLIB_CONSTRUCTORS)}."
+                )
+            )
+
+    document = _sanitize(
+        dictionary,
+        use_approximation=use_approximation,
+        behavior_on_error=behavior_on_error,
+        maximal_recursion=maximal_recursion,
+    ).encode("utf-8")
+
+    def compute_hash(algorithm: str) -> str:
+        return _HASHLIB_CONSTRUCTORS[algorithm](
+            document, **_HASH_CONSTRUCTOR_KWARGS
+        ).hexdigest()
+
+    if len(algorithms) <= 1 or len(document) < _MINIMAL_THREADED_DOCUMENT_SIZE:
+        return {algorithm: compute_hash(algorithm) for algorithm in algorithms}
+
+    with ThreadPoolExecutor(max_workers=len(algorithms)) as executor:
+        return dict(zip(algorithms, executor.map(compute_hash, algorithms)))
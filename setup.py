@@ -37,9 +37,15 @@ test_deps = [
     "random_dict",
     "pytest-readme",
     "netaddr",
+    "blake3>=0.3.1",
+    "xxhash>=2.0.0",
 ]
 
-extras = {"test": test_deps}
+extras = {
+    "test": test_deps,
+    "blake3": ["blake3>=0.3.1"],
+    "xxhash": ["xxhash>=2.0.0"],
+}
 
 setup(
     name="dict_hash",
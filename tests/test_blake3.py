@@ -0,0 +1,16 @@
+"""Tests for the optional blake3 hash."""
+
+import pytest
+from dict_hash import blake3, sha256, ALL_AVAILABLE_HASHES
+from .utils import create_dict
+
+
+def test_blake3():
+    """Test that the blake3 hash is consistent and listed when available."""
+    pytest.importorskip("blake3")
+    d = create_dict()
+    assert blake3 in ALL_AVAILABLE_HASHES
+    assert blake3(d) == blake3(d)
+    assert len(blake3(d)) == 64
+    assert blake3(d) != sha256(d)
+    assert blake3({"a": 1, "b": 2}) == blake3({"b": 2, "a": 1})
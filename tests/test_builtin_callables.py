@@ -0,0 +1,13 @@
+"""Tests for the hashing of builtin callables."""
+
+import hashlib
+from dict_hash import sha256
+
+
+def test_builtin_callables():
+    """Test that builtin functions and classes are hashed by their name."""
+    assert sha256({"f": len}) == sha256({"f": len})
+    assert sha256({"f": len}) == sha256({"f": "builtins.len"})
+    assert sha256({"f": len}) != sha256({"f": print})
+    assert sha256({"f": dict}) != sha256({"f": list})
+    assert sha256({"f": hashlib.sha256}) == sha256({"f": hashlib.sha256})
@@ -0,0 +1,24 @@
+"""Tests for the hashing of byte strings."""
+
+import pytest
+from dict_hash import NotHashableException, NotHashableWarning, sha256
+
+
+def test_byte_strings():
+    """Test that the byte-like objects hash as the equivalent bytes."""
+    for value in (bytearray(b"ab"), memoryview(b"ab")):
+        assert sha256({"k": value}) == sha256({"k": b"ab"})
+        assert sha256({"k": [value]}) == sha256({"k": [b"ab"]})
+    assert sha256({"k": bytearray(b"ab")}) != sha256({"k": bytearray(b"xy")})
+
+
+def test_binary_byte_strings():
+    """Test that byte-like objects that are not valid UTF-8 follow the error behaviour."""
+    for value in (bytearray(b"\xff"), memoryview(b"\xff")):
+        with pytest.raises(NotHashableException):
+            sha256({"k": value})
+        with pytest.warns(NotHashableWarning):
+            sha256({"k": value}, behavior_on_error="warn")
+        assert sha256({"k": value}, behavior_on_error="ignore") == sha256(
+            {"k": value}, behavior_on_error="ignore"
+        )
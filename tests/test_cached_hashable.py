@@ -0,0 +1,43 @@
+"""Tests for the CachedHashable class."""
+
+import pytest
+from dict_hash import CachedHashable, Hashable, validate_consistent_hash, sha256
+
+
+class MyCachedHashable(CachedHashable):
+    """A class that implements the _consistent_hash method."""
+
+    def __init__(self, a: int):
+        self._a = a
+        self.calls = 0
+
+    def set_a(self, a: int):
+        """Set the attribute a and invalidate the cached hash."""
+        self._a = a
+        self.invalidate()
+
+    def _consistent_hash(self, use_approximation: bool = False) -> str:
+        self.calls += 1
+        return sha256({"a": self._a}, use_approximation=use_approximation)
+
+
+def test_cached_hashable():
+    """Test that the CachedHashable class computes its hash only once."""
+    with pytest.raises(TypeError):
+        CachedHashable()  # pylint: disable=abstract-class-instantiated
+
+    a = MyCachedHashable(2)
+    b = MyCachedHashable(2)
+    assert isinstance(a, Hashable)
+    assert validate_consistent_hash(a, b)
+    assert sha256({"my_hashable": a}) == sha256({"my_hashable": b})
+    assert a.consistent_hash() == sha256({"a": 2})
+    assert a.calls == 1
+
+    a.consistent_hash(use_approximation=True)
+    assert a.calls == 2
+
+    a.set_a(3)
+    assert not validate_consistent_hash(a, b)
+    assert a.consistent_hash() == sha256({"a": 3})
+    assert a.calls == 3
@@ -0,0 +1,35 @@
+"""Tests for the dict_hash_batch function."""
+
+import pytest
+from dict_hash import dict_hash_batch, md5, sha256
+from .utils import create_dict
+
+
+def test_dict_hash_batch():
+    """Test that the batch hashes match the hashes of the single dictionaries."""
+    dictionaries = [create_dict() for _ in range(8)]
+
+    assert dict_hash_batch(dictionaries) == [sha256(d) for d in dictionaries]
+    assert dict_hash_batch(iter(dictionaries), hash_function=md5) == [
+        md5(d) for d in dictionaries
+    ]
+    assert dict_hash_batch(dictionaries, n_workers=2) == [
+        sha256(d) for d in dictionaries
+    ]
+    assert not dict_hash_batch([], n_workers=2)
+
+    with pytest.raises(ValueError):
+        dict_hash_batch(dictionaries, n_workers=0)
+
+
+def test_dict_hash_batch_unpicklable():
+    """Test that dictionaries that cannot be pickled are hashed all the same."""
+
+    def local_function(x):
+        return x
+
+    dictionaries = [{"lambda": lambda x: x}, {"local": local_function}]
+    hashes = [sha256(d) for d in dictionaries]
+
+    assert dict_hash_batch(dictionaries) == hashes
+    assert dict_hash_batch(dictionaries, n_workers=2) == hashes
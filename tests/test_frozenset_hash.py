@@ -0,0 +1,11 @@
+"""Tests for the hashing of frozensets."""
+
+from dict_hash import sha256
+
+
+def test_frozenset_hash():
+    """Test that frozensets are hashed by their elements."""
+    assert sha256({"k": frozenset([1, 2, 3])}) == sha256({"k": frozenset([3, 1, 2])})
+    assert sha256({"k": frozenset([1, 2, 3])}) == sha256({"k": {1, 2, 3}})
+    assert sha256({"k": frozenset([1, 2, 3])}) != sha256({"k": frozenset([1, 2])})
+    assert sha256({frozenset([1, 2]): 1}) != sha256({frozenset([1, 3]): 1})
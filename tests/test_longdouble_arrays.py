@@ -0,0 +1,15 @@
+"""Tests for the hashing of arrays of extended precision floats."""
+
+import numpy as np
+import pytest
+from dict_hash import NotHashableException, sha256
+
+
+def test_longdouble_arrays():
+    """Test that longdouble arrays follow the requested error behaviour."""
+    d = {"a": np.array([1.5], dtype=np.longdouble)}
+    with pytest.raises(NotHashableException):
+        sha256(d)
+    assert sha256(d, behavior_on_error="ignore") == sha256(
+        d, behavior_on_error="ignore"
+    )
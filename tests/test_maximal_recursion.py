@@ -0,0 +1,36 @@
+"""Tests for the depth at which the maximal recursion is exceeded."""
+
+import numpy as np
+import pytest
+from dict_hash import sha256
+
+
+def test_maximal_recursion():
+    """Test that the leaves within containers count against the maximal recursion."""
+    for d, depth in (
+        ({"a": 1}, 2),
+        ({"a": {"b": {"c": 1}}}, 6),
+        ({"a": [[[[1]]]]}, 6),
+        ({"a": 1, "b": [1, [2]]}, 4),
+        ({"a": (1, (2,))}, 4),
+        ({"a": {1, 2}}, 3),
+        ({"x": np.ones((3, 3))}, 7),
+        ({"x": np.ones((2, 3, 4))}, 7),
+        ({"x": [np.ones(3)]}, 8),
+        ({"x": np.ones((0, 3))}, 6),
+    ):
+        sha256(d, maximal_recursion=depth)
+        with pytest.raises(RecursionError):
+            sha256(d, maximal_recursion=depth - 1)
+
+
+def test_shared_maximal_recursion():
+    """Test that a container first found shallower counts its deeper occurrences."""
+    shared = [[[1]]]
+    for d in (
+        {"a": shared, "b": [[[[shared]]]]},
+        {"b": [[[[shared]]]], "a": shared},
+    ):
+        sha256(d, maximal_recursion=9)
+        with pytest.raises(RecursionError):
+            sha256(d, maximal_recursion=8)
@@ -0,0 +1,20 @@
+"""Tests for the multi_hash function."""
+
+import pytest
+import dict_hash
+from dict_hash import multi_hash
+from .utils import create_dict
+
+
+def test_multi_hash():
+    """Test that multi_hash matches the hashes of the single algorithms."""
+    algorithms = ["md5", "sha256", "sha3_512", "blake2b"]
+    for d in (create_dict(), {"large": "a" * 2_000_000}):
+        hashes = multi_hash(d, algorithms)
+        assert list(hashes) == algorithms
+        for algorithm, digest in hashes.items():
+            assert digest == getattr(dict_hash, algorithm)(d)
+        assert not multi_hash(d, [])
+
+    with pytest.raises(ValueError):
+        multi_hash(create_dict(), ["sha256", "crc32"])
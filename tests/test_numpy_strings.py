@@ -0,0 +1,18 @@
+"""Tests for the hashing of numpy strings."""
+
+import numpy as np
+from dict_hash import ALL_AVAILABLE_HASHES, dict_hash
+
+
+class MyString(np.str_):
+    """A subclass of the numpy string type."""
+
+
+def test_numpy_strings():
+    """Test that numpy strings hash as the equivalent python strings."""
+    for value in (np.str_("x"), MyString("x"), np.bytes_(b"x")):
+        assert dict_hash({"k": value}) == dict_hash({"k": "x"})
+        for consistent_hash_function in ALL_AVAILABLE_HASHES:
+            assert consistent_hash_function({"k": value}) == consistent_hash_function(
+                {"k": "x"}
+            )
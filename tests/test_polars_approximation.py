@@ -0,0 +1,19 @@
+"""Tests for the approximated hash of Polars objects."""
+
+import numpy as np
+import pytest
+from dict_hash import sha256
+
+
+def test_polars_approximation():
+    """Test that the approximated hash of large Polars objects is deterministic."""
+    pl = pytest.importorskip("polars")
+    data = np.random.RandomState(42).random_sample(
+        (1000, 60)
+    )  # pylint: disable=no-member
+    d = {
+        "dataframe": pl.DataFrame(data),
+        "series": pl.Series("a", data[:, 0]),
+    }
+    assert sha256(d, use_approximation=True) == sha256(d, use_approximation=True)
+    assert sha256(d, use_approximation=True) != sha256(d)
@@ -0,0 +1,58 @@
+"""Test that containers shared within a dictionary are hashed consistently."""
+
+import copy
+import numpy as np
+from dict_hash import ALL_AVAILABLE_HASHES, Hashable, dict_hash, sha256
+
+
+class CountingHashable(Hashable):
+    """A class that counts how many times its hash is computed."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def consistent_hash(self, use_approximation: bool = False) -> str:
+        self.calls += 1
+        return sha256({"a": 1})
+
+
+def test_shared_substructures():
+    """Test that sharing a container yields the same hash of copying it."""
+    template = {"a": [1, 2, 3], "b": {"c": {4, 5}}}
+    shared = {"records": [template] * 10, "template": template}
+    copied = {
+        "records": [copy.deepcopy(template) for _ in range(10)],
+        "template": copy.deepcopy(template),
+    }
+
+    assert dict_hash(shared) == dict_hash(copied)
+    for consistent_hash_function in ALL_AVAILABLE_HASHES:
+        assert consistent_hash_function(shared) == consistent_hash_function(copied)
+
+
+def test_shared_objects():
+    """Test that objects shared within a dictionary are converted once."""
+    hashable = CountingHashable()
+    array = np.arange(100)
+    shared = {"records": [{"h": hashable, "x": array}] * 10}
+    copied = {
+        "records": [{"h": CountingHashable(), "x": array.copy()} for _ in range(10)]
+    }
+
+    assert sha256(shared) == sha256(copied)
+    assert hashable.calls == 1
+
+
+class Holder:
+    """A class holding an array, hashed through its attributes."""
+
+    def __init__(self, array):
+        self.array = array
+
+
+def test_shared_objects_within_attributes():
+    """Test that objects shared with attributes are hashed as copies are."""
+    array = np.random.rand(500, 3)
+    assert sha256({"b": array, "a": Holder(array)}, use_approximation=True) == sha256(
+        {"b": array, "a": Holder(array.copy())}, use_approximation=True
+    )
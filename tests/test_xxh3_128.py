@@ -0,0 +1,16 @@
+"""Tests for the optional xxh3_128 hash."""
+
+import pytest
+from dict_hash import xxh3_128, md5, ALL_AVAILABLE_HASHES
+from .utils import create_dict
+
+
+def test_xxh3_128():
+    """Test that the xxh3_128 hash is consistent and listed when available."""
+    pytest.importorskip("xxhash")
+    d = create_dict()
+    assert xxh3_128 in ALL_AVAILABLE_HASHES
+    assert xxh3_128(d) == xxh3_128(d)
+    assert len(xxh3_128(d)) == 32
+    assert xxh3_128(d) != md5(d)
+    assert xxh3_128({"a": 1, "b": 2}) == xxh3_128({"b": 2, "a": 1})
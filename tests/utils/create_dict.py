@@ -1,6 +1,7 @@
 """Create a dictionary with random values for testing purposes."""
 
 from typing import Dict, Any
+import functools
 import random
 import datetime
 import re
@@ -9,10 +10,18 @@ from random_dict import random_dict
 from netaddr import EUI
 
 
+@functools.lru_cache(maxsize=None)
+def _create_random_dict(seed: int) -> Dict[Any, Any]:
+    """Create the random part of the dictionary, which is the slowest to build."""
+    random.seed(seed)
+    return random_dict(random.randint(0, 10), random.randint(0, 10))
+
+
 def create_dict(seed=0) -> Dict[Any, Any]:
     """Create a dictionary with random values for testing purposes."""
-    random.seed(seed)
-    d = random_dict(random.randint(0, 10), random.randint(0, 10))
+    # Tests only ever replace the values of the returned dictionary,
+    # so a shallow copy of the cached random values is enough.
+    d = dict(_create_random_dict(seed))
     try:
         from numba import typed  # pylint: disable=import-outside-toplevel
 